@@ -305,8 +305,8 @@ async def get_azure_repo_structure(request: AzureRepoStructureRequest):
              logger.debug(f"Token length: {len(request.token)}")
         
         # Create client and get structure
-        client = AzureDevOpsClient(request.repo_url, request.token)
-        structure = client.get_repo_structure(request.branch)
+        with AzureDevOpsClient(request.repo_url, request.token) as client:
+            structure = client.get_repo_structure(request.branch)
         
         return AzureRepoStructureResponse(
             file_tree=structure['file_tree'],
@@ -3,14 +3,38 @@ Azure DevOps integration module for DeepWiki.
 Handles URL parsing, API calls, and git operations for Azure DevOps Services and Server.
 """
 
+import io
 import os
 import re
-import base64
+import string
+import functools
+import threading
+import weakref
 import logging
+import zipfile
 import requests
-from urllib.parse import urlparse, quote
-from typing import Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit, quote, unquote
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, Iterable, List, Mapping, Tuple, Union
+from dataclasses import dataclass, field
+
+try:
+    import ijson  # Optional: stream large item listings instead of loading them whole
+except ImportError:
+    ijson = None
+
+try:
+    from pybase64 import b64encode as _b64encode  # Optional: SIMD-accelerated base64
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+try:
+    from orjson import loads as _json_loads  # Optional: faster JSON decoding for large API responses
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +42,35 @@ logger = logging.getLogger(__name__)
 DEFAULT_API_VERSION = "7.1"
 SSL_VERIFY_ENV = "DEEPWIKI_AZURE_DEVOPS_SSL_VERIFY"
 
+# Message for HTTP 401 responses; callers match on the "Unauthorized" prefix
+UNAUTHORIZED_MESSAGE = "Unauthorized: Invalid or missing PAT."
+
+# Item listings at least this large (or of unknown size) are parsed incrementally
+STREAM_JSON_MIN_BYTES = 1024 * 1024
+
+# Retry policy for transient Azure DevOps failures (throttling, gateway errors)
+_RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    raise_on_status=False,
+)
 
-@dataclass
+# Characters allowed in cache/database slugs; anything else becomes '_'
+_SLUG_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+_SLUG_UNSAFE = re.compile(r'[^a-zA-Z0-9_-]')
+# Translation table for the ASCII fast path: unsafe code points map to '_'
+_SLUG_TABLE = {
+    c: c if chr(c) in _SLUG_SAFE_CHARS else ord('_')
+    for c in range(128)
+}
+
+
+class AzureAuthError(ValueError):
+    """Azure DevOps rejected the request's credentials (HTTP 401)."""
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class AzureRepoInfo:
     """Data class to hold parsed Azure DevOps repository information."""
     host: str
@@ -29,8 +80,28 @@ class AzureRepoInfo:
     api_base: str
     clone_url: str
     is_server: bool  # True for Azure DevOps Server/TFS, False for Services
+    slug: str = field(init=False, repr=False, compare=False)  # cache/database name, derived
+    
+    def __post_init__(self) -> None:
+        parts = [self.organization, self.project, self.repository]
+        # For custom hosts, include host to ensure uniqueness; dev.azure.com can be omitted
+        if self.host != 'dev.azure.com':
+            parts.insert(0, self.host.split('.')[0])  # Use first part of host
+        object.__setattr__(self, 'slug', '_'.join(_sanitize_slug_part(p) for p in parts))
 
 
+def _sanitize_slug_part(s: str) -> str:
+    """Replace dots, slashes, and other special chars with underscores."""
+    if s.isascii():
+        return s.translate(_SLUG_TABLE)
+    return _SLUG_UNSAFE.sub('_', s)
+
+
+# Parsed repo info by normalized URL, kept only while some caller still holds it
+_REPO_INFO_INTERN: "weakref.WeakValueDictionary[str, AzureRepoInfo]" = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=256)
 def parse_azure_repo_url(repo_url: str) -> Optional[AzureRepoInfo]:
     """
     Parse an Azure DevOps repository URL and extract components.
@@ -40,6 +111,9 @@ def parse_azure_repo_url(repo_url: str) -> Optional[AzureRepoInfo]:
     - Azure DevOps Services (old): https://{org}.visualstudio.com/{project}/_git/{repo}
     - Azure DevOps Server/TFS: https://{host}/{collection}/{project}/_git/{repo}
     
+    Results are memoized per URL string; the returned AzureRepoInfo is frozen
+    so it can be shared safely between callers.
+    
     Args:
         repo_url: The Azure DevOps repository URL
         
@@ -49,79 +123,72 @@ def parse_azure_repo_url(repo_url: str) -> Optional[AzureRepoInfo]:
     if not repo_url:
         return None
     
-    repo_url = repo_url.strip().rstrip('/')
+    # Normalize: drop surrounding whitespace, trailing slash and .git suffix
+    repo_url = repo_url.strip().rstrip('/').removesuffix('.git')
     
-    # Remove .git suffix if present
-    if repo_url.endswith('.git'):
-        repo_url = repo_url[:-4]
+    # Cheap substring pre-check rejects non-Azure URLs before any parsing
+    if not is_azure_repo_url(repo_url):
+        logger.warning(f"Not an Azure DevOps URL: {repo_url}")
+        return None
+    
+    # Spelling variants of a URL (.git suffix, trailing slash) share one info object
+    interned = _REPO_INFO_INTERN.get(repo_url)
+    if interned is not None:
+        return interned
     
     try:
-        parsed = urlparse(repo_url)
+        parsed = urlsplit(repo_url)
         host = parsed.netloc.lower()
-        path_parts = [p for p in parsed.path.split('/') if p]
+        # Split the path once around the first _git segment:
+        # .../{project}/_git/{repo}[/...]
+        before_git_path, git_sep, after_git_path = parsed.path.partition('/_git/')
+        before_git = list(filter(None, before_git_path.split('/')))
         
-        logger.debug(f"Parsing Azure URL: host={host}, path_parts={path_parts}")
-        
-        # Check if this is an Azure DevOps URL
-        is_azure = False
-        is_server = False
+        logger.debug(f"Parsing Azure URL: host={host}, before_git={before_git}, after_git={after_git_path}")
         
         # Azure DevOps Services patterns
-        if 'dev.azure.com' in host:
-            is_azure = True
-            is_server = False
-        elif 'visualstudio.com' in host:
-            is_azure = True
+        if 'dev.azure.com' in host or 'visualstudio.com' in host:
             is_server = False
         # Check for _git in path (indicates Azure DevOps)
-        elif '_git' in path_parts:
-            is_azure = True
+        elif git_sep:
             is_server = True  # Assume Server/TFS for custom hosts
-        
-        if not is_azure:
+        else:
             logger.warning(f"Not an Azure DevOps URL: {repo_url}")
             return None
         
-        # Find the _git position in path
-        try:
-            git_index = path_parts.index('_git')
-        except ValueError:
+        if not git_sep:
             logger.warning(f"Could not find '_git' in Azure DevOps URL: {repo_url}")
             return None
         
-        # Extract repository name (after _git)
-        if git_index + 1 >= len(path_parts):
+        # Extract repository name (first segment after _git)
+        repository = after_git_path.lstrip('/').partition('/')[0]
+        if not repository:
             logger.warning(f"Missing repository name in Azure DevOps URL: {repo_url}")
             return None
-        repository = path_parts[git_index + 1]
         
-        # Extract project (before _git)
-        if git_index < 1:
+        # Extract project (segment before _git)
+        if not before_git:
             logger.warning(f"Missing project in Azure DevOps URL: {repo_url}")
             return None
-        project = path_parts[git_index - 1]
+        project = before_git[-1]
         
         # Extract organization/collection
         if host == 'dev.azure.com':
             # Services format: https://dev.azure.com/{org}/{project}/_git/{repo}
-            if git_index < 2:
+            if len(before_git) < 2:
                 logger.warning(f"Missing organization in Azure DevOps URL: {repo_url}")
                 return None
-            organization = path_parts[0]
+            organization = before_git[0]
         elif 'visualstudio.com' in host:
             # Old Services format: https://{org}.visualstudio.com/{project}/_git/{repo}
             organization = host.split('.')[0]
         else:
             # Server/TFS format: https://{host}/[virtualdir]/.../{collection}/{project}/_git/{repo}
-            if git_index < 2:
+            if len(before_git) < 2:
                 logger.warning(f"Missing collection in Azure DevOps URL: {repo_url}")
                 return None
-            collection = path_parts[git_index - 2]
-            virtual_dir_parts = path_parts[:git_index - 2]
-            if virtual_dir_parts:
-                organization = "/".join(virtual_dir_parts + [collection])
-            else:
-                organization = collection
+            # Virtual dirs (if any) plus the collection
+            organization = "/".join(before_git[:-1])
         
         # Build API base URL
         scheme = parsed.scheme or 'https'
@@ -140,7 +207,7 @@ def parse_azure_repo_url(repo_url: str) -> Optional[AzureRepoInfo]:
         
         logger.debug(f"Parsed Azure DevOps: org={organization}, project={project}, repo={repository}, api_base={api_base}")
         
-        return AzureRepoInfo(
+        info = AzureRepoInfo(
             host=host,
             organization=organization,
             project=project,
@@ -149,6 +216,8 @@ def parse_azure_repo_url(repo_url: str) -> Optional[AzureRepoInfo]:
             clone_url=clone_url,
             is_server=is_server
         )
+        _REPO_INFO_INTERN[repo_url] = info
+        return info
         
     except Exception as e:
         logger.error(f"Error parsing Azure DevOps URL '{repo_url}': {e}")
@@ -168,37 +237,27 @@ def is_azure_repo_url(repo_url: str) -> bool:
     if not repo_url:
         return False
     
-    repo_url = repo_url.lower()
-    
-    # Check for common Azure DevOps domains
-    if 'dev.azure.com' in repo_url:
-        return True
-    if 'visualstudio.com' in repo_url:
-        return True
-    
-    # Check for _git in path (Azure DevOps pattern)
-    if '/_git/' in repo_url:
-        return True
-    
-    return False
+    # Most URLs are already lowercase; skip the copy in that case
+    url = repo_url if repo_url.islower() else repo_url.lower()
+    # Azure DevOps Services domains, or the _git path segment used by Server/TFS
+    return 'dev.azure.com' in url or 'visualstudio.com' in url or '/_git/' in url
 
 
-def create_azure_auth_header(pat: str) -> str:
+def create_azure_auth_header(pat: Union[str, bytes]) -> str:
     """
     Create the Basic Authentication header value for Azure DevOps.
     
     Azure DevOps uses Basic Auth with an empty username and PAT as password.
     
     Args:
-        pat: Personal Access Token
+        pat: Personal Access Token, as text or already-encoded bytes
         
     Returns:
         The Authorization header value (e.g., "Basic base64encoded")
     """
-    # Azure DevOps Basic Auth: ":{PAT}" encoded in base64
-    auth_string = f":{pat}"
-    encoded = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-    return f"Basic {encoded}"
+    pat_bytes = pat if isinstance(pat, bytes) else pat.encode('utf-8')
+    # Azure DevOps Basic Auth: ":{PAT}" encoded in base64, decoded once at the end
+    return (b'Basic ' + _b64encode(b':' + pat_bytes)).decode('ascii')
 
 
 def mask_pat_in_string(text: str, pat: str) -> str:
@@ -215,22 +274,72 @@ def mask_pat_in_string(text: str, pat: str) -> str:
     if not pat or not text:
         return text
     
-    # Mask raw PAT
-    masked = text.replace(pat, "***PAT***")
-    
-    # Also mask base64-encoded PAT (both with and without empty username)
+    # Plain substring checks: no regex is compiled, so re's pattern cache never holds the PAT
+    masked = text
+    # Also mask base64-encoded PAT (both with and without empty username);
+    # encoded forms go first so they are never partially masked as the raw PAT
     try:
-        encoded_with_colon = base64.b64encode(f":{pat}".encode('utf-8')).decode('utf-8')
-        masked = masked.replace(encoded_with_colon, "***ENCODED_PAT***")
-        
-        encoded_plain = base64.b64encode(pat.encode('utf-8')).decode('utf-8')
-        masked = masked.replace(encoded_plain, "***ENCODED_PAT***")
+        for encoded in _encoded_pat_variants(pat):
+            if encoded in masked:
+                masked = masked.replace(encoded, "***ENCODED_PAT***")
     except Exception:
         pass
     
+    if pat in masked:
+        masked = masked.replace(pat, "***PAT***")
+    
     return masked
 
 
+def _encoded_pat_variants(pat: str) -> Tuple[str, str]:
+    """Base64 forms of a PAT, with and without the empty Basic-auth username."""
+    pat_bytes = pat.encode('utf-8')
+    return (
+        _b64encode(b':' + pat_bytes).decode('ascii'),
+        _b64encode(pat_bytes).decode('ascii'),
+    )
+
+
+class PatMasker:
+    """
+    Masks one PAT, raw and base64-encoded, in text.
+    
+    The encoded forms and the matching regex are built once, so a masker can be
+    reused for every message that may contain the same PAT.
+    """
+    
+    __slots__ = ('_pattern', '_replacements')
+    
+    def __init__(self, pat: str):
+        """
+        Args:
+            pat: The PAT to mask (must be non-empty)
+        """
+        if not pat:
+            raise ValueError("PAT to mask must be non-empty")
+        
+        self._replacements: Dict[str, str] = {pat: "***PAT***"}
+        # Also mask base64-encoded PAT (both with and without empty username)
+        try:
+            for encoded in _encoded_pat_variants(pat):
+                self._replacements.setdefault(encoded, "***ENCODED_PAT***")
+        except Exception:
+            pass
+        
+        # Longest first so an encoded form is never partially masked as the raw PAT
+        variants = sorted(self._replacements, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(re.escape(v) for v in variants))
+    
+    def mask(self, text: str) -> str:
+        """Return text with every form of the PAT replaced in a single pass."""
+        if not text:
+            return text
+        return self._pattern.sub(self._replace, text)
+    
+    def _replace(self, match: re.Match) -> str:
+        return self._replacements[match.group(0)]
+
+
 def get_azure_repo_slug(info: AzureRepoInfo) -> str:
     """
     Generate a unique slug for cache/database naming.
@@ -241,23 +350,24 @@ def get_azure_repo_slug(info: AzureRepoInfo) -> str:
     Returns:
         A slug in format: host_org_project_repo (sanitized)
     """
-    # Sanitize each component
-    def sanitize(s: str) -> str:
-        # Replace dots, slashes, and other special chars with underscores
-        return re.sub(r'[^a-zA-Z0-9_-]', '_', s)
-    
-    # For dev.azure.com, we can simplify the slug
-    if info.host == 'dev.azure.com':
-        return f"{sanitize(info.organization)}_{sanitize(info.project)}_{sanitize(info.repository)}"
-    else:
-        # For custom hosts, include host to ensure uniqueness
-        host_part = sanitize(info.host.split('.')[0])  # Use first part of host
-        return f"{host_part}_{sanitize(info.organization)}_{sanitize(info.project)}_{sanitize(info.repository)}"
+    # Computed once when the info is created
+    return info.slug
 
 
 class AzureDevOpsClient:
     """Client for interacting with Azure DevOps REST API."""
     
+    # Static query parameters of the items endpoint; per-call values are merged in
+    _FILE_TREE_PARAMS_BASE = {
+        'scopePath': '/',
+        'recursionLevel': 'Full',
+        'includeContentMetadata': 'true',
+    }
+    _FILE_CONTENT_PARAMS_BASE = {
+        'includeContent': 'true',
+        '$format': 'text',  # Get raw text content
+    }
+    
     def __init__(self, repo_url: str, pat: Optional[str] = None, api_version: str = DEFAULT_API_VERSION):
         """
         Initialize Azure DevOps client.
@@ -277,6 +387,43 @@ class AzureDevOpsClient:
         self.pat = pat
         self.api_version = api_version
         
+        # The repository name comes from the URL path and may already be percent-encoded
+        repository = quote(unquote(self.repo_info.repository), safe='')
+        self._repo_url_base = f"{self.repo_info.api_base}/_apis/git/repositories/{repository}"
+        
+        # Azure DevOps PATs are ASCII; validate once and keep the encoded bytes
+        try:
+            self._pat_bytes: Optional[bytes] = pat.encode('ascii') if pat else None
+        except UnicodeEncodeError:
+            raise ValueError("Invalid Azure DevOps PAT: tokens must contain only ASCII characters.") from None
+        
+        # The PAT never changes, so the Basic auth header is built once
+        self._auth_header: Optional[str] = create_azure_auth_header(self._pat_bytes) if self._pat_bytes else None
+        
+        # Read-only header template; _get_headers hands out shallow copies
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
+        if self._auth_header:
+            headers['Authorization'] = self._auth_header
+        self._headers_view: Mapping[str, str] = MappingProxyType(headers)
+        
+        # PAT forms to mask in error messages, matched in a single regex pass
+        self._pat_masker: Optional[PatMasker] = PatMasker(pat) if pat else None
+        
+        # Pooled session so consecutive API calls reuse the TCP/TLS connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY_POLICY)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update(self._get_headers())
+        
+        # Repository metadata cached for the lifetime of the client
+        self._repo_info_json: Optional[Dict[str, Any]] = None
+        self._default_branch: Optional[str] = None
+        self._default_branch_lock = threading.Lock()
+        
         logger.debug(f"Azure DevOps Client initialized:")
         logger.debug(f"  Host: {self.repo_info.host}")
         logger.debug(f"  Organization/Collection: {self.repo_info.organization}")
@@ -285,16 +432,31 @@ class AzureDevOpsClient:
         logger.debug(f"  API Base: {self.repo_info.api_base}")
         logger.debug(f"  Is Server: {self.repo_info.is_server}")
         logger.debug(f"  Has PAT: {bool(self.pat)}")
+    
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._session.close()
+    
+    def invalidate_cache(self) -> None:
+        """Forget cached repository metadata (e.g. after the default branch changed)."""
+        self._repo_info_json = None
+        self._default_branch = None
+    
+    def __enter__(self) -> "AzureDevOpsClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
         
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests."""
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        if self.pat:
-            headers['Authorization'] = create_azure_auth_header(self.pat)
-        return headers
+        return dict(self._headers_view)
+    
+    def _mask(self, text: str) -> str:
+        """Mask this client's PAT (raw and base64-encoded) in text."""
+        if self._pat_masker is None:
+            return text
+        return self._pat_masker.mask(text)
     
     def _make_request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
         """
@@ -308,21 +470,16 @@ class AzureDevOpsClient:
         Returns:
             Response object
         """
-        headers = kwargs.pop('headers', {})
-        headers.update(self._get_headers())
-
         if 'verify' not in kwargs:
             kwargs['verify'] = self._get_ssl_verify()
         
         try:
-            response = requests.request(method, url, headers=headers, **kwargs)
+            # Auth and content-type headers are already set on the session
+            response = self._session.request(method, url, **kwargs)
             return response
         except requests.RequestException as e:
             # Mask PAT in error message
-            error_msg = str(e)
-            if self.pat:
-                error_msg = mask_pat_in_string(error_msg, self.pat)
-            raise requests.RequestException(error_msg)
+            raise requests.RequestException(self._mask(str(e)))
 
     def _get_ssl_verify(self) -> bool | str:
         """
@@ -351,7 +508,7 @@ class AzureDevOpsClient:
         Returns:
             Repository information dict
         """
-        url = f"{self.repo_info.api_base}/_apis/git/repositories/{self.repo_info.repository}"
+        url = self._repo_url_base
         params = {'api-version': self.api_version}
         
         logger.debug(f"Getting repo info from: {url}")
@@ -373,7 +530,7 @@ class AzureDevOpsClient:
             raise
 
         if response.status_code == 401:
-            raise ValueError("Unauthorized: Invalid or missing PAT. Please check your Personal Access Token.")
+            raise AzureAuthError(f"{UNAUTHORIZED_MESSAGE} Please check your Personal Access Token.")
         elif response.status_code == 403:
             raise ValueError("Forbidden: Your PAT doesn't have permission to access this repository. Ensure it has 'Code (Read)' scope.")
         elif response.status_code == 404:
@@ -387,25 +544,36 @@ class AzureDevOpsClient:
             )
         
         response.raise_for_status()
-        return response.json()
+        self._repo_info_json = self._parse_json(response)
+        return self._repo_info_json
     
     def get_default_branch(self) -> str:
         """
         Get the default branch of the repository.
         
+        The result is cached on the client; see invalidate_cache().
+        
         Returns:
             Default branch name (e.g., 'main', 'master')
         """
-        try:
-            repo_info = self.get_repository_info()
-            default_branch = repo_info.get('defaultBranch', 'refs/heads/main')
-            # Remove refs/heads/ prefix if present
-            if default_branch.startswith('refs/heads/'):
-                default_branch = default_branch[len('refs/heads/'):]
-            return default_branch
-        except Exception as e:
-            logger.warning(f"Could not get default branch, using 'main': {e}")
-            return 'main'
+        if self._default_branch is not None:
+            return self._default_branch
+        
+        # Concurrent callers wait for a single lookup instead of each fetching
+        with self._default_branch_lock:
+            if self._default_branch is not None:
+                return self._default_branch
+            try:
+                repo_info = self._repo_info_json or self.get_repository_info()
+                default_branch = repo_info.get('defaultBranch', 'refs/heads/main')
+                # Remove refs/heads/ prefix if present
+                if default_branch.startswith('refs/heads/'):
+                    default_branch = default_branch[len('refs/heads/'):]
+                self._default_branch = default_branch
+                return default_branch
+            except Exception as e:
+                logger.warning(f"Could not get default branch, using 'main': {e}")
+                return 'main'
     
     def get_file_tree(self, branch: Optional[str] = None) -> list:
         """
@@ -420,39 +588,60 @@ class AzureDevOpsClient:
         if not branch:
             branch = self.get_default_branch()
         
-        url = f"{self.repo_info.api_base}/_apis/git/repositories/{self.repo_info.repository}/items"
+        url = f"{self._repo_url_base}/items"
         params = {
-            'scopePath': '/',
-            'recursionLevel': 'Full',
-            'includeContentMetadata': 'true',
+            **self._FILE_TREE_PARAMS_BASE,
             'versionDescriptor.version': branch,
             'api-version': self.api_version
         }
         
-        response = self._make_request(url, params=params)
-        
-        if response.status_code == 401:
-            raise ValueError("Unauthorized: Invalid or missing PAT.")
-        elif response.status_code == 403:
-            raise ValueError("Forbidden: Insufficient permissions.")
-        elif response.status_code == 404:
-            raise ValueError(f"Repository or branch not found: {branch}")
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Extract file paths from the response
-        files = []
-        items = data.get('value', [])
-        for item in items:
-            if item.get('gitObjectType') == 'blob':
-                path = item.get('path', '')
-                if path.startswith('/'):
-                    path = path[1:]  # Remove leading slash
-                files.append(path)
+        # Only hold the body open for incremental parsing when ijson can do it
+        response = self._make_request(url, params=params, stream=ijson is not None)
+        try:
+            if response.status_code == 401:
+                raise AzureAuthError(UNAUTHORIZED_MESSAGE)
+            elif response.status_code == 403:
+                raise ValueError("Forbidden: Insufficient permissions.")
+            elif response.status_code == 404:
+                raise ValueError(f"Repository or branch not found: {branch}")
+            
+            response.raise_for_status()
+            
+            if self._should_stream_json(response):
+                # Parse items one by one rather than materialising the whole listing
+                response.raw.decode_content = True
+                items = ijson.items(response.raw, 'value.item')
+            else:
+                items = self._parse_json(response).get('value', [])
+            
+            # Extract file paths from the response
+            files = []
+            for item in items:
+                if item.get('gitObjectType') == 'blob':
+                    path = item.get('path', '')
+                    if path.startswith('/'):
+                        path = path[1:]  # Remove leading slash
+                    files.append(path)
+        finally:
+            response.close()
         
         return files
     
+    @staticmethod
+    def _should_stream_json(response: requests.Response) -> bool:
+        """Whether a JSON response is large (or unsized) enough to parse incrementally."""
+        if ijson is None:
+            return False
+        content_length = response.headers.get('Content-Length')
+        if not content_length or not content_length.isdigit():
+            return True
+        return int(content_length) >= STREAM_JSON_MIN_BYTES
+    
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Any:
+        """Decode a JSON response body from its raw bytes (with orjson when available)."""
+        return _json_loads(response.content)
+    
     def get_file_content(self, file_path: str, branch: Optional[str] = None) -> str:
         """
         Get the content of a specific file.
@@ -471,19 +660,18 @@ class AzureDevOpsClient:
         if not file_path.startswith('/'):
             file_path = '/' + file_path
         
-        url = f"{self.repo_info.api_base}/_apis/git/repositories/{self.repo_info.repository}/items"
+        url = f"{self._repo_url_base}/items"
         params = {
+            **self._FILE_CONTENT_PARAMS_BASE,
             'path': file_path,
-            'includeContent': 'true',
             'versionDescriptor.version': branch,
             'api-version': self.api_version,
-            '$format': 'text'  # Get raw text content
         }
         
         response = self._make_request(url, params=params)
         
         if response.status_code == 401:
-            raise ValueError("Unauthorized: Invalid or missing PAT.")
+            raise AzureAuthError(UNAUTHORIZED_MESSAGE)
         elif response.status_code == 403:
             raise ValueError("Forbidden: Insufficient permissions.")
         elif response.status_code == 404:
@@ -492,30 +680,156 @@ class AzureDevOpsClient:
         response.raise_for_status()
         return response.text
     
-    def get_readme(self, branch: Optional[str] = None) -> str:
+    def get_file_contents(self, file_paths: List[str], branch: Optional[str] = None) -> Dict[str, str]:
+        """
+        Get the contents of several files using two batched requests.
+        
+        Blob ids are resolved with one itemsbatch call and all blobs are then
+        downloaded together as a zip, instead of one request per file.
+        
+        Args:
+            file_paths: Paths of the files to fetch
+            branch: Branch name (uses default branch if not specified)
+            
+        Returns:
+            Dict mapping each requested path to its content; paths that do not
+            resolve to a file, or whose content is not valid UTF-8, are omitted
+        """
+        if not file_paths:
+            return {}
+        if not branch:
+            branch = self.get_default_branch()
+        
+        # Resolve every path to its blob id in a single round trip
+        descriptors = [
+            {
+                'path': path if path.startswith('/') else '/' + path,
+                'version': branch,
+                'versionType': 'branch',
+            }
+            for path in file_paths
+        ]
+        response = self._make_request(
+            f"{self._repo_url_base}/itemsbatch",
+            method='POST',
+            params={'api-version': self.api_version},
+            json={'itemDescriptors': descriptors},
+        )
+        
+        if response.status_code == 401:
+            raise AzureAuthError(UNAUTHORIZED_MESSAGE)
+        elif response.status_code == 403:
+            raise ValueError("Forbidden: Insufficient permissions.")
+        elif response.status_code == 404:
+            raise ValueError(f"Repository, branch or requested files not found: {branch}")
+        
+        response.raise_for_status()
+        
+        # One list of items per descriptor, in request order
+        batch = self._parse_json(response).get('value', [])
+        if len(batch) != len(file_paths):
+            raise ValueError(
+                f"Unexpected itemsbatch response: {len(batch)} results for {len(file_paths)} paths"
+            )
+        paths_by_blob: Dict[str, List[str]] = {}
+        for path, items in zip(file_paths, batch):
+            for item in items:
+                if item.get('gitObjectType') == 'blob' and item.get('objectId'):
+                    paths_by_blob.setdefault(item['objectId'], []).append(path)
+                    break
+        
+        if not paths_by_blob:
+            return {}
+        
+        # Download all blobs in one zip; entries are named by blob id
+        response = self._make_request(
+            f"{self._repo_url_base}/blobs",
+            method='POST',
+            params={'api-version': self.api_version},
+            headers={'Accept': 'application/zip'},
+            json=list(paths_by_blob),
+        )
+        
+        if response.status_code == 401:
+            raise AzureAuthError(UNAUTHORIZED_MESSAGE)
+        elif response.status_code == 403:
+            raise ValueError("Forbidden: Insufficient permissions.")
+        elif response.status_code == 404:
+            raise ValueError(f"Requested blobs not found on branch: {branch}")
+        
+        response.raise_for_status()
+        
+        contents: Dict[str, str] = {}
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            for name in archive.namelist():
+                paths = paths_by_blob.get(name.rsplit('/', 1)[-1])
+                if not paths:
+                    continue
+                try:
+                    text = archive.read(name).decode('utf-8')
+                except UnicodeDecodeError:
+                    # Binary blob; skip it rather than return mangled text
+                    continue
+                for path in paths:
+                    contents[path] = text
+        
+        return contents
+    
+    def get_readme(self, branch: Optional[str] = None, file_tree: Optional[list] = None) -> str:
         """
         Try to get the README file content.
         
         Args:
             branch: Branch name (uses default branch if not specified)
+            file_tree: File paths already listed by get_file_tree; when given,
+                only README candidates present in it are fetched
             
         Returns:
             README content or empty string if not found
         """
         readme_names = ['README.md', 'README.MD', 'readme.md', 'README.txt', 'README']
         
-        for readme_name in readme_names:
+        if not branch:
+            branch = self.get_default_branch()
+        
+        if file_tree is not None:
+            # The listing already tells us which candidates exist, so fetch them
+            # in priority order; the first lookup normally succeeds
+            present = set(file_tree)
+            readme = self._first_readme(
+                functools.partial(self.get_file_content, readme_name, branch)
+                for readme_name in readme_names
+                if readme_name in present
+            )
+        else:
+            # Look up all candidates concurrently, but keep the priority order above.
+            # Leaving the block waits for every lookup, so none outlives the session.
+            with ThreadPoolExecutor(max_workers=len(readme_names)) as executor:
+                futures = [
+                    executor.submit(self.get_file_content, readme_name, branch)
+                    for readme_name in readme_names
+                ]
+                readme = self._first_readme(future.result for future in futures)
+        
+        if readme is not None:
+            return readme
+        
+        logger.info("No README file found in repository")
+        return ''
+    
+    @staticmethod
+    def _first_readme(lookups: Iterable[Callable[[], str]]) -> Optional[str]:
+        """Return the result of the first README lookup that finds a file."""
+        for lookup in lookups:
             try:
-                return self.get_file_content(readme_name, branch)
+                return lookup()
             except ValueError as e:
                 if 'not found' in str(e).lower():
                     continue
                 raise
             except Exception:
                 continue
-        
-        logger.info("No README file found in repository")
-        return ''
+        return None
     
     def get_repo_structure(self, branch: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -531,7 +845,7 @@ class AzureDevOpsClient:
             branch = self.get_default_branch()
         
         file_tree = self.get_file_tree(branch)
-        readme = self.get_readme(branch)
+        readme = self.get_readme(branch, file_tree=file_tree)
         
         return {
             'file_tree': '\n'.join(file_tree),
@@ -552,8 +866,8 @@ def generate_azure_file_url(repo_url: str, file_path: str, branch: str = 'main')
     Returns:
         Web URL for the file
     """
-    info = parse_azure_repo_url(repo_url)
-    if not info:
+    prefix = _azure_file_url_prefix(repo_url)
+    if prefix is None:
         return file_path
     
     # Ensure file_path starts with /
@@ -563,5 +877,14 @@ def generate_azure_file_url(repo_url: str, file_path: str, branch: str = 'main')
     # URL encode the path
     encoded_path = quote(file_path, safe='/')
     
+    return f"{prefix}{encoded_path}&version=GB{branch}"
+
+
+@functools.lru_cache(maxsize=256)
+def _azure_file_url_prefix(repo_url: str) -> Optional[str]:
+    """Per-repository part of the Azure DevOps file URL, up to the path value."""
+    info = parse_azure_repo_url(repo_url)
+    if not info:
+        return None
     # Azure DevOps file URL format
-    return f"{info.api_base}/_git/{info.repository}?path={encoded_path}&version=GB{branch}"
+    return f"{info.api_base}/_git/{info.repository}?path="
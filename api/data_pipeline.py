@@ -765,8 +765,8 @@ def get_azure_file_content(repo_url: str, file_path: str, access_token: str = No
     try:
         from api.azure_devops import AzureDevOpsClient, mask_pat_in_string
         
-        client = AzureDevOpsClient(repo_url, access_token)
-        content = client.get_file_content(file_path)
+        with AzureDevOpsClient(repo_url, access_token) as client:
+            content = client.get_file_content(file_path)
         return content
         
     except ValueError as e:
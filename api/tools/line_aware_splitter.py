@@ -1,14 +1,58 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Sequence, List
+from typing import Iterable, Iterator, Sequence, List
 
+import numpy as np
 from adalflow.core.component import DataComponent
 from adalflow.core.types import Document
 
 
 SPLITTER_VERSION = 2
 
+# Documents at least this long are scanned for newlines with NumPy.
+_VECTORIZED_SCAN_MIN_CHARS = 64_000
+
+
+def _line_starts(text: str) -> List[int]:
+    """Return the offset of every line start in `text`, ending with `len(text)`.
+
+    Lines end at "\n", "\r\n" or a lone "\r" (classic Mac endings), as editors
+    number them; other str.splitlines separators such as "\f" do not end a line.
+    Line `i` (0-indexed) is `text[starts[i]:starts[i + 1]]`, including its line
+    ending.
+    """
+    has_cr = "\r" in text
+    if len(text) >= _VECTORIZED_SCAN_MIN_CHARS and text.isascii():
+        # Byte offsets equal character offsets for ASCII text.
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        ends = buf == 0x0A
+        if has_cr:
+            lone_cr = buf == 0x0D
+            lone_cr[:-1] &= buf[1:] != 0x0A
+            ends |= lone_cr
+        starts = [0]
+        starts.extend((np.flatnonzero(ends) + 1).tolist())
+        if starts[-1] != len(text):
+            starts.append(len(text))
+        return starts
+
+    starts = [0]
+    pos = text.find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    if has_cr:
+        # A "\r" not followed by "\n" ends a line on its own.
+        pos = text.find("\r")
+        while pos != -1:
+            if not text.startswith("\n", pos + 1):
+                starts.append(pos + 1)
+            pos = text.find("\r", pos + 1)
+        starts.sort()
+    if starts[-1] != len(text):
+        starts.append(len(text))
+    return starts
+
 
 class LineAwareTextSplitter(DataComponent):
     """Split documents into line-based chunks while preserving line ranges.
@@ -17,6 +61,7 @@ class LineAwareTextSplitter(DataComponent):
     - `chunk_size` and `chunk_overlap` are interpreted as *number of lines*
     - `start_line`/`end_line` are 1-indexed and inclusive
     - Adds `chunk_index` and `splitter_version` to meta_data
+    - meta_data is shallow-copied per chunk; its values are treated as immutable
     """
 
     def __init__(self, chunk_size: int = 120, chunk_overlap: int = 30, **_: object) -> None:
@@ -32,45 +77,40 @@ class LineAwareTextSplitter(DataComponent):
         self.chunk_overlap = chunk_overlap
 
     def __call__(self, documents: Sequence[Document]) -> Sequence[Document]:
-        output: List[Document] = []
+        return list(self.iter_chunks(documents))
 
+    def iter_chunks(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """Yield chunks one at a time instead of materialising the full list."""
         for doc in documents:
             if not getattr(doc, "text", None):
                 continue
 
-            # Keep line endings so the chunk text matches original formatting.
-            lines = doc.text.splitlines(keepends=True)
-            if not lines:
-                continue
+            # Slice chunks out of the original text so line endings are preserved.
+            text = doc.text
+            line_starts = _line_starts(text)
+            n_lines = len(line_starts) - 1
 
-            base_meta = deepcopy(getattr(doc, "meta_data", {}) or {})
+            base_meta = getattr(doc, "meta_data", {}) or {}
             file_path = base_meta.get("file_path")
 
+            # Chunk start lines are a plain arithmetic progression.
             step = self.chunk_size - self.chunk_overlap
-            chunk_index = 0
-            start = 0
-            while start < len(lines):
-                end = min(start + self.chunk_size, len(lines))
+            for chunk_index, start in enumerate(range(0, n_lines, step)):
+                end = min(start + self.chunk_size, n_lines)
 
-                chunk_text = "".join(lines[start:end])
+                chunk_text = text[line_starts[start]:line_starts[end]]
                 # Convert to 1-indexed inclusive line numbers.
                 start_line = start + 1
                 end_line = end
 
-                meta = deepcopy(base_meta)
-                meta.update(
-                    {
-                        "file_path": file_path,
-                        "start_line": start_line,
-                        "end_line": end_line,
-                        "chunk_index": chunk_index,
-                        "splitter_version": SPLITTER_VERSION,
-                    }
-                )
-
-                output.append(Document(text=chunk_text, meta_data=meta))
-
-                chunk_index += 1
-                start += step
-
-        return output
+                # One merged dict per chunk; base_meta itself is never mutated.
+                meta = {
+                    **base_meta,
+                    "file_path": file_path,
+                    "start_line": start_line,
+                    "end_line": end_line,
+                    "chunk_index": chunk_index,
+                    "splitter_version": SPLITTER_VERSION,
+                }
+
+                yield Document(text=chunk_text, meta_data=meta)
@@ -1,5 +1,6 @@
 import pytest
 from adalflow.core.types import Document
+from api.tools import line_aware_splitter
 from api.tools.line_aware_splitter import LineAwareTextSplitter
 
 class TestLineAwareSplitter:
@@ -48,6 +49,58 @@ class TestLineAwareSplitter:
         assert chunks[0].meta_data["author"] == "me"
         assert chunks[0].meta_data["splitter_version"] == 2
 
+    def test_iter_chunks_matches_call(self):
+        text = "\n".join([f"Line {i}" for i in range(1, 11)])
+        doc = Document(text=text, meta_data={"file_path": "test.txt"})
+        splitter = LineAwareTextSplitter(chunk_size=4, chunk_overlap=1)
+
+        streamed = splitter.iter_chunks([doc])
+
+        assert not isinstance(streamed, list)
+        assert [c.text for c in streamed] == [c.text for c in splitter([doc])]
+
+    def test_crlf_line_endings(self):
+        doc = Document(text="L1\r\nL2\r\nL3\r\n", meta_data={"file_path": "win.txt"})
+        splitter = LineAwareTextSplitter(chunk_size=2, chunk_overlap=0)
+        chunks = splitter([doc])
+
+        # "\r\n" ends a single line and is kept in the chunk text
+        assert [c.text for c in chunks] == ["L1\r\nL2\r\n", "L3\r\n"]
+        assert [(c.meta_data["start_line"], c.meta_data["end_line"]) for c in chunks] == [(1, 2), (3, 3)]
+
+    def test_lone_carriage_return_ends_a_line(self):
+        # Classic Mac "\r" endings split lines; "\f" does not
+        doc = Document(text="a\rb\fc\r\nd\re", meta_data={"file_path": "mixed.txt"})
+        splitter = LineAwareTextSplitter(chunk_size=1, chunk_overlap=0)
+        chunks = splitter([doc])
+
+        assert [c.text for c in chunks] == ["a\r", "b\fc\r\n", "d\r", "e"]
+        assert [(c.meta_data["start_line"], c.meta_data["end_line"]) for c in chunks] == [
+            (1, 1), (2, 2), (3, 3), (4, 4)
+        ]
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    @pytest.mark.parametrize("trailing_newline", [True, False])
+    def test_large_ascii_document_matches_small_text_path(self, monkeypatch, newline, trailing_newline):
+        text = newline.join(f"line {i:05d} " + "x" * (i % 50) for i in range(3000))
+        if trailing_newline:
+            text += newline
+        assert len(text) >= line_aware_splitter._VECTORIZED_SCAN_MIN_CHARS
+        doc = Document(text=text, meta_data={"file_path": "big.txt"})
+        splitter = LineAwareTextSplitter(chunk_size=120, chunk_overlap=30)
+
+        vectorized = splitter([doc])
+        # Raise the threshold so the same document takes the str.find loop
+        monkeypatch.setattr(line_aware_splitter, "_VECTORIZED_SCAN_MIN_CHARS", len(text) + 1)
+        scanned = splitter([doc])
+
+        assert [c.text for c in vectorized] == [c.text for c in scanned]
+        assert [(c.meta_data["start_line"], c.meta_data["end_line"]) for c in vectorized] == [
+            (c.meta_data["start_line"], c.meta_data["end_line"]) for c in scanned
+        ]
+        assert vectorized[0].text == "".join(text.splitlines(keepends=True)[:120])
+        assert vectorized[-1].meta_data["end_line"] == 3000
+
     def test_empty_document(self):
         doc = Document(text="", meta_data={})
         splitter = LineAwareTextSplitter()
@@ -4,14 +4,21 @@ Unit tests for Azure DevOps integration module.
 
 import pytest
 import base64
+import json
+import io
+import zipfile
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from api.azure_devops import (
     parse_azure_repo_url,
     is_azure_repo_url,
     create_azure_auth_header,
     mask_pat_in_string,
+    PatMasker,
     get_azure_repo_slug,
     AzureRepoInfo,
+    AzureAuthError,
     AzureDevOpsClient,
     generate_azure_file_url,
 )
@@ -96,6 +103,27 @@ class TestParseAzureRepoUrl:
         result = parse_azure_repo_url(None)
         assert result is None
 
+    def test_repeated_parse_returns_cached_info(self):
+        """Test that parsing the same URL twice returns the shared cached result."""
+        url = "https://dev.azure.com/myorg/myproject/_git/myrepo"
+
+        assert parse_azure_repo_url(url) is parse_azure_repo_url(url)
+
+    def test_url_variants_share_info(self):
+        """Test that spelling variants of one repository URL share a single info object."""
+        url = "https://dev.azure.com/myorg/myproject/_git/sharedrepo"
+        info = parse_azure_repo_url(url)
+
+        assert parse_azure_repo_url(url + ".git") is info
+        assert parse_azure_repo_url(url + "/") is info
+
+    def test_parsed_info_is_immutable(self):
+        """Test that cached repo info cannot be mutated by callers."""
+        result = parse_azure_repo_url("https://dev.azure.com/myorg/myproject/_git/myrepo")
+
+        with pytest.raises(AttributeError):
+            result.repository = "other"
+
 
 class TestIsAzureRepoUrl:
     """Tests for is_azure_repo_url function."""
@@ -153,6 +181,18 @@ class TestCreateAzureAuthHeader:
         decoded = base64.b64decode(encoded_part).decode('utf-8')
         assert decoded == f":{pat}"
 
+    def test_uses_pybase64_when_installed(self):
+        """Test that the speedups extra's pybase64 encoder is picked up."""
+        pybase64 = pytest.importorskip("pybase64")
+        from api import azure_devops
+        
+        assert azure_devops._b64encode is pybase64.b64encode
+        assert create_azure_auth_header("mypattoken123") == "Basic " + base64.b64encode(b":mypattoken123").decode()
+
+    def test_bytes_pat(self):
+        """Test that an already-encoded PAT yields the same header as text."""
+        assert create_azure_auth_header(b"mypattoken123") == create_azure_auth_header("mypattoken123")
+
 
 class TestMaskPatInString:
     """Tests for mask_pat_in_string function."""
@@ -176,6 +216,33 @@ class TestMaskPatInString:
         assert encoded not in result
         assert "***ENCODED_PAT***" in result
 
+    def test_mask_raw_and_base64_pat_together(self):
+        """Test that both PAT forms are masked when they appear in the same text."""
+        pat = "secretpat123"
+        encoded = base64.b64encode(f":{pat}".encode()).decode()
+        text = f"token {pat} header Basic {encoded}"
+        result = mask_pat_in_string(text, pat)
+        
+        assert pat not in result
+        assert encoded not in result
+        assert result == "token ***PAT*** header Basic ***ENCODED_PAT***"
+
+    def test_text_without_pat_is_unchanged(self):
+        """Test that text not containing the PAT is returned as is."""
+        text = "Error: connection reset by peer"
+        assert mask_pat_in_string(text, "secretpat123") == text
+
+    def test_pat_not_kept_in_regex_cache(self):
+        """Test that masking compiles no pattern that would keep the PAT in re's cache."""
+        import re
+        pat = "supersecretPAT42"
+        re.purge()
+        
+        mask_pat_in_string(f"token {pat}", pat)
+        
+        cached_keys = [*getattr(re, '_cache', {}), *getattr(re, '_cache2', {})]
+        assert not any(pat in str(key) for key in cached_keys)
+
     def test_empty_text(self):
         """Test with empty text."""
         result = mask_pat_in_string("", "pat")
@@ -193,6 +260,25 @@ class TestMaskPatInString:
         assert result is None
 
 
+class TestPatMasker:
+    """Tests for PatMasker class."""
+
+    def test_masker_is_reusable(self):
+        """Test that one masker masks every message containing its PAT."""
+        pat = "secretpat123"
+        encoded = base64.b64encode(f":{pat}".encode()).decode()
+        masker = PatMasker(pat)
+        
+        assert masker.mask(f"token {pat}") == "token ***PAT***"
+        assert masker.mask(f"Basic {encoded}") == "Basic ***ENCODED_PAT***"
+        assert masker.mask("nothing to hide") == "nothing to hide"
+
+    def test_empty_pat_rejected(self):
+        """Test that an empty PAT cannot be used to build a masker."""
+        with pytest.raises(ValueError):
+            PatMasker("")
+
+
 class TestGetAzureRepoSlug:
     """Tests for get_azure_repo_slug function."""
 
@@ -229,6 +315,13 @@ class TestGetAzureRepoSlug:
         assert "myproject" in slug
         assert "myrepo" in slug
 
+    def test_slug_is_precomputed_on_parsed_info(self):
+        """Test that parsed repo info carries its slug."""
+        info = parse_azure_repo_url("https://azuredevops.company.com/DefaultCollection/my.project/_git/myrepo")
+        
+        assert info.slug == "azuredevops_DefaultCollection_my_project_myrepo"
+        assert get_azure_repo_slug(info) == info.slug
+
     def test_slug_sanitizes_special_chars(self):
         """Test that slug sanitizes special characters."""
         info = AzureRepoInfo(
@@ -293,6 +386,14 @@ class TestAzureDevOpsClient:
         assert client.repo_info is not None
         assert client.pat == "testpat"
 
+    def test_repository_name_is_url_encoded(self):
+        """Test that API URLs encode the repository name exactly once."""
+        client = AzureDevOpsClient("https://dev.azure.com/myorg/myproject/_git/my%20repo")
+        
+        assert client._repo_url_base == (
+            "https://dev.azure.com/myorg/myproject/_apis/git/repositories/my%20repo"
+        )
+
     def test_client_invalid_url(self):
         """Test client initialization with invalid URL raises error."""
         with pytest.raises(ValueError):
@@ -310,6 +411,47 @@ class TestAzureDevOpsClient:
         assert "Authorization" in headers
         assert headers["Authorization"].startswith("Basic ")
 
+    def test_non_ascii_pat_rejected(self):
+        """Test that a non-ASCII PAT is rejected up front without echoing it."""
+        with pytest.raises(ValueError, match="ASCII") as exc_info:
+            AzureDevOpsClient(
+                "https://dev.azure.com/myorg/myproject/_git/myrepo",
+                "tëstpat"
+            )
+        
+        assert "tëstpat" not in str(exc_info.value)
+        assert exc_info.value.__context__ is None or exc_info.value.__suppress_context__
+
+    def test_get_headers_returns_independent_copies(self):
+        """Test that mutating returned headers doesn't affect later calls."""
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo",
+            "testpat"
+        )
+        
+        headers = client._get_headers()
+        headers["Accept"] = "application/zip"
+        
+        assert client._get_headers()["Accept"] == "application/json"
+
+    def test_session_carries_auth_header(self):
+        """Test that the pooled session sends the auth header on every request."""
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo",
+            "testpat"
+        )
+        
+        assert client._session.headers["Authorization"] == create_azure_auth_header("testpat")
+        client.close()
+
+    def test_client_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the session."""
+        with patch('api.azure_devops.requests.Session.close') as mock_close:
+            with AzureDevOpsClient("https://dev.azure.com/myorg/myproject/_git/myrepo"):
+                pass
+        
+        mock_close.assert_called_once()
+
     def test_get_headers_without_pat(self):
         """Test that headers don't include auth when no PAT."""
         client = AzureDevOpsClient(
@@ -320,16 +462,35 @@ class TestAzureDevOpsClient:
         
         assert "Authorization" not in headers
 
-    @patch('api.azure_devops.requests.request')
+    @patch('api.azure_devops.requests.Session.request')
+    def test_request_error_masks_pat(self, mock_request):
+        """Test that transport errors don't leak the PAT in raw or encoded form."""
+        pat = "secretpat123"
+        encoded = base64.b64encode(f":{pat}".encode()).decode()
+        mock_request.side_effect = requests.ConnectionError(f"failed with {pat} / Basic {encoded}")
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo",
+            pat
+        )
+        
+        with pytest.raises(requests.RequestException) as excinfo:
+            client.get_repository_info()
+        
+        assert pat not in str(excinfo.value)
+        assert encoded not in str(excinfo.value)
+        assert "***PAT***" in str(excinfo.value)
+
+    @patch('api.azure_devops.requests.Session.request')
     def test_get_repository_info(self, mock_request):
         """Test getting repository info."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "id": "repo-id",
             "name": "myrepo",
             "defaultBranch": "refs/heads/main"
-        }
+        }).encode()
         mock_request.return_value = mock_response
         
         client = AzureDevOpsClient(
@@ -342,12 +503,12 @@ class TestAzureDevOpsClient:
         assert result["name"] == "myrepo"
         assert result["defaultBranch"] == "refs/heads/main"
 
-    @patch('api.azure_devops.requests.request')
+    @patch('api.azure_devops.requests.Session.request')
     def test_get_default_branch(self, mock_request):
         """Test getting default branch."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"defaultBranch": "refs/heads/develop"}
+        mock_response.content = json.dumps({"defaultBranch": "refs/heads/develop"}).encode()
         mock_response.raise_for_status = Mock()
         mock_request.return_value = mock_response
         
@@ -359,13 +520,122 @@ class TestAzureDevOpsClient:
         
         assert result == "develop"
 
-    @patch('api.azure_devops.requests.request')
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_default_branch_is_cached(self, mock_request):
+        """Test that the default branch is fetched once per client until invalidated."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"defaultBranch": "refs/heads/develop"}).encode()
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_default_branch() == "develop"
+        assert client.get_default_branch() == "develop"
+        assert mock_request.call_count == 1
+        
+        client.invalidate_cache()
+        client.get_default_branch()
+        assert mock_request.call_count == 2
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_tree(self, mock_request):
+        """Test that the file tree lists blobs without their leading slash."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "200"}
+        mock_response.content = json.dumps({
+            "value": [
+                {"path": "/", "gitObjectType": "tree"},
+                {"path": "/src", "gitObjectType": "tree"},
+                {"path": "/src/main.py", "gitObjectType": "blob"},
+                {"path": "/README.md", "gitObjectType": "blob"},
+            ]
+        }).encode()
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_file_tree("main") == ["src/main.py", "README.md"]
+        mock_response.close.assert_called_once()
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_tree_streams_unsized_listing(self, mock_request):
+        """Test that a listing without Content-Length is parsed incrementally with ijson."""
+        pytest.importorskip("ijson")
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.raw = io.BytesIO(json.dumps({
+            "count": 3,
+            "value": [
+                {"path": "/", "gitObjectType": "tree"},
+                {"path": "/src/main.py", "gitObjectType": "blob"},
+                {"path": "/README.md", "gitObjectType": "blob"},
+            ]
+        }).encode())
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_file_tree("main") == ["src/main.py", "README.md"]
+        assert mock_request.call_args.kwargs["stream"] is True
+        mock_response.json.assert_not_called()
+        mock_response.close.assert_called_once()
+
+    def test_parse_json_decodes_raw_bytes(self):
+        """Test that responses are decoded from their bytes rather than via .json()."""
+        mock_response = Mock()
+        mock_response.content = b'{"defaultBranch": "refs/heads/main"}'
+        
+        assert AzureDevOpsClient._parse_json(mock_response) == {"defaultBranch": "refs/heads/main"}
+        mock_response.json.assert_not_called()
+
+    def test_parse_json_uses_orjson_when_installed(self):
+        """Test that the speedups extra's orjson decoder is picked up."""
+        orjson = pytest.importorskip("orjson")
+        from api import azure_devops
+        mock_response = Mock()
+        mock_response.content = b'{"value": [1, 2.5, "x"]}'
+        
+        assert azure_devops._json_loads is orjson.loads
+        assert AzureDevOpsClient._parse_json(mock_response) == {"value": [1, 2.5, "x"]}
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_default_branch_fetched_once_across_threads(self, mock_request):
+        """Test that concurrent callers share a single default-branch lookup."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"defaultBranch": "refs/heads/develop"}).encode()
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            branches = list(executor.map(lambda _: client.get_default_branch(), range(16)))
+        
+        assert branches == ["develop"] * 16
+        assert mock_request.call_count == 1
+
+    @patch('api.azure_devops.requests.Session.request')
     def test_get_file_content(self, mock_request):
         """Test getting file content."""
         # First call for default branch
         mock_branch_response = Mock()
         mock_branch_response.status_code = 200
-        mock_branch_response.json.return_value = {"defaultBranch": "refs/heads/main"}
+        mock_branch_response.content = json.dumps({"defaultBranch": "refs/heads/main"}).encode()
         mock_branch_response.raise_for_status = Mock()
         
         # Second call for file content
@@ -384,7 +654,132 @@ class TestAzureDevOpsClient:
         
         assert result == "file content here"
 
-    @patch('api.azure_devops.requests.request')
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_contents_batches_requests(self, mock_request):
+        """Test that several files are fetched with one itemsbatch and one blobs call."""
+        batch_response = Mock()
+        batch_response.status_code = 200
+        batch_response.raise_for_status = Mock()
+        batch_response.content = json.dumps({
+            "count": 3,
+            "value": [
+                [{"path": "/a.py", "gitObjectType": "blob", "objectId": "sha-a"}],
+                [{"path": "/b.py", "gitObjectType": "blob", "objectId": "sha-b"}],
+                [],
+            ],
+        }).encode()
+        
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("sha-a", "print('a')")
+            zf.writestr("sha-b", "print('b')")
+        blobs_response = Mock()
+        blobs_response.status_code = 200
+        blobs_response.raise_for_status = Mock()
+        blobs_response.content = archive.getvalue()
+        
+        mock_request.side_effect = [batch_response, blobs_response]
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        result = client.get_file_contents(["a.py", "/b.py", "missing.py"], "main")
+        
+        assert result == {"a.py": "print('a')", "/b.py": "print('b')"}
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[1].kwargs["json"] == ["sha-a", "sha-b"]
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_contents_skips_binary_blobs(self, mock_request):
+        """Test that blobs which are not valid UTF-8 are left out of the result."""
+        batch_response = Mock()
+        batch_response.status_code = 200
+        batch_response.raise_for_status = Mock()
+        batch_response.content = json.dumps({
+            "value": [
+                [{"path": "/a.py", "gitObjectType": "blob", "objectId": "sha-a"}],
+                [{"path": "/logo.png", "gitObjectType": "blob", "objectId": "sha-png"}],
+            ],
+        }).encode()
+        
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("sha-a", "print('a')")
+            zf.writestr("sha-png", b"\x89PNG\r\n\x1a\n\xff\xfe")
+        blobs_response = Mock()
+        blobs_response.status_code = 200
+        blobs_response.raise_for_status = Mock()
+        blobs_response.content = archive.getvalue()
+        
+        mock_request.side_effect = [batch_response, blobs_response]
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_file_contents(["a.py", "logo.png"], "main") == {"a.py": "print('a')"}
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_contents_short_batch_raises(self, mock_request):
+        """Test that a batch response with fewer results than paths is rejected."""
+        batch_response = Mock()
+        batch_response.status_code = 200
+        batch_response.raise_for_status = Mock()
+        batch_response.content = json.dumps({
+            "value": [
+                [{"path": "/a.py", "gitObjectType": "blob", "objectId": "sha-a"}],
+            ],
+        }).encode()
+        mock_request.return_value = batch_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        with pytest.raises(ValueError, match="1 results for 2 paths"):
+            client.get_file_contents(["a.py", "b.py"], "main")
+        assert mock_request.call_count == 1
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_contents_401_on_itemsbatch(self, mock_request):
+        """Test that a 401 while resolving blob ids raises AzureAuthError."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        with pytest.raises(AzureAuthError):
+            client.get_file_contents(["a.py"], "main")
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_file_contents_401_on_blobs(self, mock_request):
+        """Test that a 401 while downloading blobs raises AzureAuthError."""
+        batch_response = Mock()
+        batch_response.status_code = 200
+        batch_response.raise_for_status = Mock()
+        batch_response.content = json.dumps({
+            "value": [
+                [{"path": "/a.py", "gitObjectType": "blob", "objectId": "sha-a"}],
+            ],
+        }).encode()
+        blobs_response = Mock()
+        blobs_response.status_code = 401
+        
+        mock_request.side_effect = [batch_response, blobs_response]
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        with pytest.raises(AzureAuthError):
+            client.get_file_contents(["a.py"], "main")
+        blobs_response.raise_for_status.assert_not_called()
+
+    @patch('api.azure_devops.requests.Session.request')
     def test_get_file_content_401_error(self, mock_request):
         """Test file content with 401 error."""
         mock_response = Mock()
@@ -399,6 +794,81 @@ class TestAzureDevOpsClient:
             client.get_file_content("README.md")
         
         assert "Unauthorized" in str(excinfo.value)
+        assert isinstance(excinfo.value, AzureAuthError)
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_readme_prefers_first_candidate(self, mock_request):
+        """Test that README lookup returns the highest-priority file that exists."""
+        def respond(method, url, params=None, **kwargs):
+            response = Mock()
+            response.raise_for_status = Mock()
+            if params['path'] in ('/readme.md', '/README'):
+                response.status_code = 200
+                response.text = f"content of {params['path']}"
+            else:
+                response.status_code = 404
+            return response
+        
+        mock_request.side_effect = respond
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_readme("main") == "content of /readme.md"
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_readme_not_found(self, mock_request):
+        """Test that a repository without README yields an empty string."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_readme("main") == ""
+
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_readme_uses_known_file_tree(self, mock_request):
+        """Test that a known file tree limits README lookups to files that exist."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "# Title"
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_readme("main", file_tree=["src/main.py", "README"]) == "# Title"
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["params"]["path"] == "/README"
+        
+        mock_request.reset_mock()
+        assert client.get_readme("main", file_tree=["src/main.py"]) == ""
+        mock_request.assert_not_called()
+
+    @patch('api.azure_devops.ThreadPoolExecutor')
+    @patch('api.azure_devops.requests.Session.request')
+    def test_get_readme_known_file_tree_fetches_sequentially(self, mock_request, mock_executor):
+        """Test that known candidates are fetched in order without a thread pool."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "# Title"
+        mock_response.raise_for_status = Mock()
+        mock_request.return_value = mock_response
+        
+        client = AzureDevOpsClient(
+            "https://dev.azure.com/myorg/myproject/_git/myrepo"
+        )
+        
+        assert client.get_readme("main", file_tree=["README", "README.md"]) == "# Title"
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["params"]["path"] == "/README.md"
+        mock_executor.assert_not_called()
 
 
 if __name__ == "__main__":